@@ -4,16 +4,34 @@ Modern, sleek dark UI with neon accents and glass morphism effects.
 """
 from __future__ import annotations
 
+import errno
+import gzip
+import operator
+import os
+import re
 import shutil
+import stat
 import json
+import logging
+import queue
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, Set, Tuple
 from threading import Thread
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import tkinter as tk
 
+try:
+    import orjson
+except ImportError:  # optional speedup; history falls back to the stdlib json module
+    orjson = None
+
+log = logging.getLogger(__name__)
+
 # Set dark theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
@@ -34,14 +52,37 @@ COLORS = {
     "warning": "#ffa500",         # Orange
 }
 
+# Widget options resolved from the palette once, shared by the card and button builders
+GLASS_CARD_STYLE = {
+    "fg_color": COLORS["bg_card"],
+    "border_color": COLORS["border"],
+    "border_width": 1,
+    "corner_radius": 8,
+}
+STAT_CARD_COLORS = (COLORS["accent_cyan"], COLORS["accent_purple"], COLORS["accent_blue"])
+ACCENT_BUTTON_STYLE = {
+    "fg_color": COLORS["accent_cyan"],
+    "hover_color": COLORS["accent_purple"],
+    "text_color": COLORS["bg_primary"],
+    "height": 45,
+}
+PLAIN_BUTTON_STYLE = {
+    "fg_color": COLORS["bg_card"],
+    "border_color": COLORS["border"],
+    "border_width": 1,
+    "text_color": COLORS["accent_cyan"],
+    "hover_color": COLORS["bg_secondary"],
+    "height": 45,
+}
+
 # Category definition
-CATEGORY_MAP: Dict[str, Iterable[str]] = {
-    "Documents/Excel": [".xls", ".xlsx", ".xlsm", ".xlsb", ".xltx", ".csv"],
-    "Documents/Word": [".doc", ".docx", ".odt", ".rtf"],
-    "Documents/PDF": [".pdf"],
-    "Documents/Text": [".txt"],
-    "Media/Images": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".heic"],
-    "Media/Videos": [".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm", ".m4v"],
+CATEGORY_MAP: Dict[str, FrozenSet[str]] = {
+    "Documents/Excel": frozenset({".xls", ".xlsx", ".xlsm", ".xlsb", ".xltx", ".csv"}),
+    "Documents/Word": frozenset({".doc", ".docx", ".odt", ".rtf"}),
+    "Documents/PDF": frozenset({".pdf"}),
+    "Documents/Text": frozenset({".txt"}),
+    "Media/Images": frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".heic"}),
+    "Media/Videos": frozenset({".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm", ".m4v"}),
 }
 
 LEGACY_FOLDER_REMAP: Dict[str, str] = {
@@ -52,22 +93,57 @@ LEGACY_FOLDER_REMAP: Dict[str, str] = {
 }
 
 OTHER_FOLDER = "Other"
-HISTORY_FILE = Path.home() / "Documents" / "Technolize" / "organizer_history.json"
+_OTHER_PATH = Path(OTHER_FOLDER)
+_EXT_TO_DEST: Dict[str, Path] = {
+    ext: Path(dest) for dest, extensions in CATEGORY_MAP.items() for ext in extensions
+}
+# Top-level names the organizer itself creates; never categorized, so skipped by name
+SKIP_NAMES = frozenset(
+    {dest.split("/", 1)[0] for dest in CATEGORY_MAP} | {OTHER_FOLDER, *LEGACY_FOLDER_REMAP}
+)
+# Windows keeps the hidden attribute on the DirEntry, so checking it costs no extra call
+_HIDDEN_ATTRIBUTE = getattr(stat, "FILE_ATTRIBUTE_HIDDEN", 0) if os.name == "nt" else 0
+# Tabs whose content is derived from the run history
+HISTORY_TABS = ("home", "history", "stats", "settings")
+MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+HISTORY_FILE = Path.home() / "Documents" / "Technolize" / "organizer_history.json.gz"
+HISTORY_LIMIT = 50
+# Rows rendered in the preview textbox; the count label still reports the full total
+PREVIEW_ROWS = 500
+
+
+class OrganizeError(Exception):
+    """A run stopped part way; `moves` lists what was moved before the failure"""
+
+    def __init__(self, error: Exception, moves: List[Tuple[str, str]]) -> None:
+        super().__init__(str(error))
+        self.moves = moves
+
+
+def file_extension(name: str) -> str:
+    # Plain string slicing; a leading dot marks a hidden file, not an extension
+    dot = name.rfind(".")
+    return name[dot:] if dot > 0 else ""
+
 
+def resolve_extension(ext: str) -> Path | None:
+    return _EXT_TO_DEST.get(ext)
 
-def resolve_destination(file_path: Path) -> Path | None:
-    ext = file_path.suffix.lower()
-    for dest, extensions in CATEGORY_MAP.items():
-        if ext in extensions:
-            return Path(dest)
-    return None
+
+def scan_names(folder: str) -> Set[str]:
+    try:
+        with os.scandir(folder) as it:
+            return {os.path.normcase(entry.name) for entry in it}
+    except OSError:
+        # An unreadable folder counts as empty; move_path still refuses to overwrite
+        return set()
 
 
 def ensure_unique_path(target: Path) -> Path:
     if not target.exists():
         return target
-    stem, suffix = target.stem, target.suffix
     parent = target.parent
+    stem, suffix = target.stem, target.suffix
     counter = 1
     while True:
         candidate = parent / f"{stem} ({counter}){suffix}"
@@ -76,6 +152,41 @@ def ensure_unique_path(target: Path) -> Path:
         counter += 1
 
 
+def unique_target(
+    folder: str,
+    name: str,
+    known_names: Dict[str, Set[str]],
+    counters: Dict[Tuple[str, str, str], int],
+) -> str:
+    # known_names maps each destination folder to the (normcased) names it holds plus
+    # every name already handed out this run, so no two planned moves share a target.
+    names = known_names.get(folder)
+    if names is None:
+        names = known_names[folder] = scan_names(folder)
+    key = os.path.normcase(name)
+    if key not in names:
+        names.add(key)
+        return os.path.join(folder, name)
+    suffix = file_extension(name)
+    stem = name[: len(name) - len(suffix)]
+    # counters remembers the last number handed out per name, so repeated collisions
+    # (IMG_0001.jpg from several cameras) resume there instead of rescanning the folder
+    counter_key = (folder, os.path.normcase(stem), os.path.normcase(suffix))
+    counter = counters.get(counter_key)
+    if counter is None:
+        numbered = re.compile(
+            re.escape(os.path.normcase(stem)) + r" \((\d+)\)" + re.escape(os.path.normcase(suffix)) + "$"
+        )
+        counter = max((int(match.group(1)) for match in map(numbered.match, names) if match), default=0)
+    counter += 1
+    while os.path.normcase(f"{stem} ({counter}){suffix}") in names:
+        counter += 1
+    counters[counter_key] = counter
+    unique_name = f"{stem} ({counter}){suffix}"
+    names.add(os.path.normcase(unique_name))
+    return os.path.join(folder, unique_name)
+
+
 def ensure_unique_dir(target: Path) -> Path:
     if not target.exists():
         return target
@@ -88,57 +199,207 @@ def ensure_unique_dir(target: Path) -> Path:
         counter += 1
 
 
-def preview_organization(base_folder: Path) -> List[Tuple[Path, Path]]:
-    moves: List[Tuple[Path, Path]] = []
-    for entry in base_folder.iterdir():
-        if entry.is_dir():
-            continue
-        dest_subpath = resolve_destination(entry)
-        dest_root = dest_subpath if dest_subpath is not None else Path(OTHER_FOLDER)
-        dest_folder = base_folder / dest_root
-        target = ensure_unique_path(dest_folder / entry.name)
-        moves.append((entry, target))
-    return moves
-
-
-def organize_folder(base_folder: Path) -> List[Tuple[Path, Path]]:
-    moves: List[Tuple[Path, Path]] = []
-    for entry in base_folder.iterdir():
-        if entry.is_dir():
-            continue
-        dest_subpath = resolve_destination(entry)
-        dest_root = dest_subpath if dest_subpath is not None else Path(OTHER_FOLDER)
-        dest_folder = base_folder / dest_root
+def move_path(src: str, dest: str | Path) -> None:
+    # Everything stays under the chosen folder, so a single rename usually suffices;
+    # shutil.move only handles the rare case where that folder spans a mount point.
+    # os.rename (not os.replace) so an unexpected existing target fails on Windows
+    # instead of being overwritten; POSIX rename would replace it, so check first.
+    if os.name != "nt" and os.path.lexists(dest):
+        raise FileExistsError(errno.EEXIST, "Destination already exists", os.fspath(dest))
+    try:
+        os.rename(src, os.fspath(dest))
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        if os.path.isdir(src):
+            shutil.move(src, dest)
+        else:
+            # copy2 uses the platform's in-kernel copy (sendfile, fcopyfile, CopyFile2)
+            shutil.copy2(src, dest)
+            os.unlink(src)
+
+
+def plan_organization(base_folder: Path, dest_folders: Set[Path] | None = None) -> List[Tuple[str, str]]:
+    # Planning only reads the disk; destination folders the plan needs are
+    # collected into `dest_folders` when given so the caller can create them up front.
+    # Paths stay plain strings per file; Path objects are only built once per folder.
+    plan: List[Tuple[str, str]] = []
+    base = os.fspath(base_folder)
+    # A folder holds only a handful of distinct extensions, so resolve each one once per run
+    ext_folders: Dict[str, str] = {}
+    known_names: Dict[str, Set[str]] = {}
+    counters: Dict[Tuple[str, str, str], int] = {}
+    # DirEntry caches the file type, so is_dir() needs no extra stat
+    with os.scandir(base_folder) as it:
+        for entry in it:
+            name = entry.name
+            if name in SKIP_NAMES or name.startswith(".") or entry.is_dir():
+                continue
+            if _HIDDEN_ATTRIBUTE and entry.stat(follow_symlinks=False).st_file_attributes & _HIDDEN_ATTRIBUTE:
+                continue
+            ext = file_extension(name)
+            dest_folder = ext_folders.get(ext)
+            if dest_folder is None:
+                dest_folder = ext_folders[ext] = os.path.join(base, resolve_extension(ext.lower()) or _OTHER_PATH)
+                if dest_folders is not None:
+                    dest_folders.add(Path(dest_folder))
+            plan.append((entry.path, unique_target(dest_folder, name, known_names, counters)))
+    return plan
+
+
+def preview_organization(base_folder: Path) -> List[Tuple[str, str]]:
+    return plan_organization(base_folder)
+
+
+def organize_folder(
+    base_folder: Path, progress: Callable[[int, int], None] | None = None
+) -> List[Tuple[str, str]]:
+    ensured: Set[Path] = set()
+    plan = plan_organization(base_folder, ensured)
+    # One mkdir per destination folder, all before the first move
+    for dest_folder in ensured:
         dest_folder.mkdir(parents=True, exist_ok=True)
-        target = ensure_unique_path(dest_folder / entry.name)
-        shutil.move(str(entry), target)
-        moves.append((entry, target))
-    relocate_legacy_folders(base_folder, moves)
-    return moves
 
+    # Two moves onto one path would overwrite a file, so refuse before anything moves
+    if len({os.path.normcase(os.fspath(target)) for _, target in plan}) != len(plan):
+        raise ValueError("Two files were planned to the same destination; nothing was moved")
 
-def relocate_legacy_folders(base_folder: Path, moves: List[Tuple[Path, Path]]) -> None:
+    # Renames release the GIL, so slow disks and network shares can overlap them
+    pool = ThreadPoolExecutor(max_workers=MOVE_WORKERS)
+    futures = [pool.submit(move_path, src, target) for src, target in plan]
+    try:
+        for done, future in enumerate(futures, 1):
+            future.result()
+            if progress is not None:
+                progress(done, len(futures))
+    except Exception as exc:
+        # Stop at the first failure; renames already running finish, the rest never start
+        pool.shutdown(wait=True, cancel_futures=True)
+        moved = [
+            move for move, future in zip(plan, futures) if not future.cancelled() and future.exception() is None
+        ]
+        raise OrganizeError(exc, moved) from exc
+    pool.shutdown()
+
+    try:
+        relocate_legacy_folders(base_folder, plan, ensured)
+    except Exception as exc:
+        # relocate_legacy_folders appends each move as it completes
+        raise OrganizeError(exc, plan) from exc
+    return plan
+
+
+def relocate_legacy_folders(
+    base_folder: Path, moves: List[Tuple[str, str]], ensured: Set[Path] | None = None
+) -> None:
+    if ensured is None:
+        ensured = set()
     for legacy_name, dest_rel in LEGACY_FOLDER_REMAP.items():
         src_dir = base_folder / legacy_name
-        if not src_dir.exists() or not src_dir.is_dir():
+        if not src_dir.is_dir():
             continue
         dest_dir = base_folder / Path(dest_rel)
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        for item in list(src_dir.iterdir()):
+        if dest_dir not in ensured:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            ensured.add(dest_dir)
+        with os.scandir(src_dir) as it:
+            items = list(it)
+        for item in items:
             if item.is_dir():
                 target_dir = ensure_unique_dir(dest_dir / item.name)
-                shutil.move(str(item), target_dir)
-                moves.append((item, target_dir))
+                move_path(item.path, target_dir)
+                moves.append((item.path, os.fspath(target_dir)))
             else:
                 target_file = ensure_unique_path(dest_dir / item.name)
-                shutil.move(str(item), target_file)
-                moves.append((item, target_file))
+                move_path(item.path, target_file)
+                moves.append((item.path, os.fspath(target_file)))
         try:
             src_dir.rmdir()
         except OSError:
             pass
 
 
+def dump_json(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def serialize_run(run: dict) -> dict:
+    return {
+        "label": run.get("label", ""),
+        "base": str(run.get("base", "")),
+        # [src, dest] pairs; older files used {"src": ..., "dest": ...} dicts
+        "moves": [[str(src), str(dest)] for src, dest in run.get("moves", [])],
+    }
+
+
+def read_history(history_file: Path) -> List[dict]:
+    if not history_file.exists() and history_file.suffix == ".gz":
+        # Older versions saved plain JSON without the .gz suffix
+        history_file = history_file.with_suffix("")
+    if not history_file.exists():
+        return []
+    try:
+        raw = history_file.read_bytes()
+        if raw[:2] == b"\x1f\x8b":
+            raw = gzip.decompress(raw)
+        data = load_json(raw)
+        raw_runs = data if isinstance(data, list) else data.get("history", [])
+        loaded = []
+        # Runs are stored newest first, so anything past the limit would be dropped anyway
+        for run in islice(raw_runs, HISTORY_LIMIT):
+            base = Path(run.get("base", "")) if run.get("base") else Path.home()
+            moves_list = []
+            # Moves stay as strings; nothing here needs Path objects
+            for mv in run.get("moves", []):
+                try:
+                    if isinstance(mv, dict):
+                        src, dest = mv.get("src", ""), mv.get("dest", "")
+                    else:
+                        src, dest = mv
+                    moves_list.append((str(src), str(dest)))
+                except Exception:
+                    continue
+            entry = {
+                "label": run.get("label", ""),
+                "base": base,
+                "moves": moves_list,
+                "categories": run_categories(base, moves_list),
+            }
+            entry["serialized"] = serialize_run(entry)
+            loaded.append(entry)
+        return loaded
+    except Exception:
+        return []
+
+
+def run_categories(base: Path, moves: Iterable[Tuple[str, str]]) -> Dict[str, int]:
+    # Category is the destination folder relative to the run, e.g. "Documents/PDF";
+    # counted once per run so the stats tab only has to add up these small dicts
+    base_prefix = os.path.join(base, "")
+    counts: Counter[str] = Counter()
+    for src, dest in moves:
+        folder = os.path.dirname(dest)
+        if folder.startswith(base_prefix):
+            folder = folder[len(base_prefix):].replace(os.sep, "/")
+        counts[folder] += 1
+    return dict(counts)
+
+
+def relative_display(dest, base_prefix: str) -> str:
+    # base_prefix is os.path.join(base, ""), built once per list, so a root like / or
+    # C:\ keeps a single separator; slicing avoids a PurePath per row like relative_to
+    dest_str = os.fspath(dest)
+    if dest_str.startswith(base_prefix):
+        return dest_str[len(base_prefix):]
+    return dest_str
+
+
 class RiotFileOrganizer:
     def __init__(self, root: ctk.CTk) -> None:
         self.root = root
@@ -166,12 +427,33 @@ class RiotFileOrganizer:
         self.root.configure(fg_color=COLORS["bg_primary"])
 
         self.folder_var = tk.StringVar(value=str(self.default_downloads()))
-        self.history: list[dict] = []
+        # Newest first; the deque drops the oldest run once HISTORY_LIMIT is reached
+        self.history: Deque[dict] = deque(maxlen=HISTORY_LIMIT)
         self.history_file = HISTORY_FILE
         self.is_organizing = False
+        self.run_buttons: List[Tuple[ctk.CTkButton, str]] = []
         self.current_tab = "home"
-
-        self.load_history()
+        self.tab_frames: Dict[str, ctk.CTkFrame] = {}
+        self.active_view: ctk.CTkFrame | None = None
+        self.history_list: ctk.CTkScrollableFrame | None = None
+        self.history_entries: List[ctk.CTkFrame] = []
+        self.history_loaded = False
+        self.closing = False
+        self.history_dirty = False
+        self.history_save_job: str | None = None
+        self.history_writer = ThreadPoolExecutor(max_workers=1)
+        # Serialized runs last handed to the writer (or read from disk); lets a save that
+        # changes nothing be skipped. Cleared again by save_history if that write fails.
+        self.saved_runs: List[dict] | None = None
+        self.category_counts: Dict[str, int] | None = None
+        self.total_files_moved = 0
+        self.progress_queue: queue.Queue[Tuple[int, int]] = queue.Queue()
+        self.progress_job: str | None = None
+        self.font_cache: Dict[Tuple[str, int, str], ctk.CTkFont] = {}
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Started once the mainloop runs, so the worker's root.after has a loop to post to
+        self.root.after_idle(self.load_history)
         self.apply_custom_styles()
         self.build_ui()
 
@@ -186,6 +468,23 @@ class RiotFileOrganizer:
         self.style_title = ctk.CTkFont(family="Segoe UI", size=32, weight="bold")
         self.style_heading = ctk.CTkFont(family="Segoe UI", size=18, weight="bold")
         self.style_label = ctk.CTkFont(family="Segoe UI", size=12)
+        # Shared fonts for rows and cards; one Tk font each instead of one per widget
+        self.style_large = ctk.CTkFont(family="Segoe UI", size=14)
+        self.style_caption = ctk.CTkFont(family="Segoe UI", size=11)
+        self.style_arrow = ctk.CTkFont(family="Segoe UI", size=16)
+        self.style_tiny_bold = ctk.CTkFont(family="Segoe UI", size=10, weight="bold")
+        self.style_button = ctk.CTkFont(family="Segoe UI", size=11, weight="bold")
+        self.style_small_bold = ctk.CTkFont(family="Segoe UI", size=12, weight="bold")
+        self.style_bold = ctk.CTkFont(family="Segoe UI", size=13, weight="bold")
+        self.style_large_bold = ctk.CTkFont(family="Segoe UI", size=14, weight="bold")
+        self.style_mono = ctk.CTkFont(family="Courier", size=13)
+        # Shared by every sidebar button so each one does not allocate its own font
+        self.nav_button_style = {
+            "text_color": COLORS["text_secondary"],
+            "font": self.style_tiny_bold,
+            "fg_color": "transparent",
+            "hover_color": COLORS["bg_card"],
+        }
 
     def build_ui(self) -> None:
         """Build main UI with Riot client aesthetic"""
@@ -232,7 +531,7 @@ class RiotFileOrganizer:
             sidebar,
             text="⚙️ SETTINGS",
             text_color=COLORS["text_secondary"],
-            font=ctk.CTkFont(family="Segoe UI", size=11, weight="bold"),
+            font=self.style_button,
             fg_color="transparent",
             hover_color=COLORS["bg_card"],
             command=lambda: self.switch_tab("settings"),
@@ -250,55 +549,80 @@ class RiotFileOrganizer:
         btn = ctk.CTkButton(
             parent,
             text=f"{icon} {label}",
-            text_color=COLORS["text_secondary"],
-            font=ctk.CTkFont(family="Segoe UI", size=10, weight="bold"),
-            fg_color="transparent",
-            hover_color=COLORS["bg_card"],
             command=lambda: self.switch_tab(tab_id),
+            **self.nav_button_style,
         )
         btn.pack(fill="x", padx=15, pady=8)
         self.nav_buttons[tab_id] = btn
 
     def switch_tab(self, tab_id: str) -> None:
         """Switch to a different tab"""
+        # Update nav colors; only the previously and newly active buttons change
+        previous_btn = self.nav_buttons.get(self.current_tab)
+        if previous_btn is not None:
+            previous_btn.configure(
+                text_color=COLORS["text_secondary"],
+                fg_color="transparent",
+            )
+        active_btn = self.nav_buttons.get(tab_id)
+        if active_btn is not None:
+            active_btn.configure(
+                text_color=COLORS["accent_cyan"],
+                fg_color=COLORS["bg_card"],
+            )
         self.current_tab = tab_id
 
-        # Update nav colors
-        for tid, btn in self.nav_buttons.items():
-            if tid == tab_id:
-                btn.configure(
-                    text_color=COLORS["accent_cyan"],
-                    fg_color=COLORS["bg_card"],
-                )
+        # Cached views are only hidden so they can be packed again instead of rebuilt
+        previous, self.active_view = self.active_view, None
+        if previous is not None:
+            if previous in self.tab_frames.values():
+                previous.pack_forget()
             else:
-                btn.configure(
-                    text_color=COLORS["text_secondary"],
-                    fg_color="transparent",
-                )
+                previous.destroy()
 
-        # Clear content
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+        view = self.tab_frames.get(tab_id)
+        if view is None:
+            view = self.build_tab(tab_id)
+        view.pack(fill="both", expand=True)
+        self.active_view = view
 
-        # Load tab
+    def build_tab(self, tab_id: str) -> ctk.CTkFrame:
+        """Build a tab into its own frame, caching it unless it shows live data"""
+        view = ctk.CTkFrame(self.content_area, fg_color="transparent")
         if tab_id == "home":
-            self.show_home()
+            self.show_home(view)
         elif tab_id == "organize":
-            self.show_organize()
+            self.show_organize(view)
         elif tab_id == "preview":
-            self.show_preview()
+            self.show_preview(view)
         elif tab_id == "history":
-            self.show_history()
+            self.show_history(view)
         elif tab_id == "stats":
-            self.show_stats()
+            self.show_stats(view)
         elif tab_id == "settings":
-            self.show_settings()
-
-    def show_home(self) -> None:
+            self.show_settings(view)
+        # Preview reflects whatever is in the folder right now, so it is rebuilt per visit
+        if tab_id != "preview":
+            self.tab_frames[tab_id] = view
+        return view
+
+    def invalidate_history_tabs(self, tab_ids: Iterable[str] = HISTORY_TABS) -> None:
+        """Drop cached tabs that display history so they rebuild with fresh data"""
+        for tab_id in tab_ids:
+            view = self.tab_frames.pop(tab_id, None)
+            if view is None:
+                continue
+            if view is self.active_view:
+                self.active_view = None
+            view.destroy()
+        if self.active_view is None:
+            self.switch_tab(self.current_tab)
+
+    def show_home(self, view: ctk.CTkFrame) -> None:
         """Home/Dashboard tab"""
         # Header
         header = ctk.CTkLabel(
-            self.content_area,
+            view,
             text="TECHNOLIZE ORGANIZER",
             font=self.style_title,
             text_color=COLORS["accent_cyan"],
@@ -306,24 +630,25 @@ class RiotFileOrganizer:
         header.pack(anchor="w", pady=(0, 10))
 
         subtitle = ctk.CTkLabel(
-            self.content_area,
+            view,
             text="Organize your files effortlessly",
-            font=ctk.CTkFont(family="Segoe UI", size=14),
+            font=self.style_large,
             text_color=COLORS["text_secondary"],
         )
         subtitle.pack(anchor="w", pady=(0, 30))
 
         # Stats cards row
-        stats_frame = ctk.CTkFrame(self.content_area, fg_color="transparent")
+        stats_frame = ctk.CTkFrame(view, fg_color="transparent")
         stats_frame.pack(fill="x", pady=(0, 30))
 
         last_run = self.history[0] if self.history else None
         stats = [
             ("RUNS", len(self.history)),
-            ("FILES MOVED", sum(len(h["moves"]) for h in self.history)),
+            ("FILES MOVED", self.total_files_moved),
             ("LAST RUN", last_run["label"].split("•")[0].strip() if last_run else "NEVER"),
         ]
 
+        self.configure_stat_row(stats_frame, len(stats))
         for i, (label, value) in enumerate(stats):
             self.create_stat_card(stats_frame, label, str(value), i, font_size=18)
 
@@ -331,7 +656,7 @@ class RiotFileOrganizer:
         # Users can click HOME, ORGANIZE, PREVIEW tabs directly in sidebar
 
         # Info section
-        info_frame = self.create_glass_card(self.content_area)
+        info_frame = self.create_glass_card(view)
         info_frame.pack(fill="both", expand=True, pady=(0, 10))
 
         info_title = ctk.CTkLabel(
@@ -356,7 +681,7 @@ class RiotFileOrganizer:
             num_label = ctk.CTkLabel(
                 step_frame,
                 text=num,
-                font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
+                font=self.style_large_bold,
                 text_color=color,
                 width=30,
             )
@@ -365,18 +690,18 @@ class RiotFileOrganizer:
             text_label = ctk.CTkLabel(
                 step_frame,
                 text=text,
-                font=ctk.CTkFont(family="Segoe UI", size=13),
+                font=self.style,
                 text_color=COLORS["text_secondary"],
             )
             text_label.pack(side="left", anchor="w")
 
         ctk.CTkLabel(info_frame, text="").pack(pady=10)
 
-    def show_organize(self) -> None:
+    def show_organize(self, view: ctk.CTkFrame) -> None:
         """Organize tab"""
         # Header
         header = ctk.CTkLabel(
-            self.content_area,
+            view,
             text="ORGANIZE",
             font=self.style_title,
             text_color=COLORS["accent_cyan"],
@@ -384,7 +709,7 @@ class RiotFileOrganizer:
         header.pack(anchor="w", pady=(0, 20))
 
         # Folder selection card
-        select_card = self.create_glass_card(self.content_area)
+        select_card = self.create_glass_card(view)
         select_card.pack(fill="x", pady=(0, 20))
 
         select_title = ctk.CTkLabel(
@@ -402,7 +727,7 @@ class RiotFileOrganizer:
         self.folder_entry = ctk.CTkEntry(
             input_frame,
             textvariable=self.folder_var,
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=self.style_caption,
             text_color=COLORS["text_primary"],
             fg_color=COLORS["bg_primary"],
             border_color=COLORS["border"],
@@ -414,7 +739,7 @@ class RiotFileOrganizer:
         browse_btn = ctk.CTkButton(
             input_frame,
             text="BROWSE",
-            font=ctk.CTkFont(family="Segoe UI", size=11, weight="bold"),
+            font=self.style_button,
             fg_color=COLORS["accent_purple"],
             hover_color=COLORS["accent_cyan"],
             text_color=COLORS["bg_primary"],
@@ -424,7 +749,7 @@ class RiotFileOrganizer:
         browse_btn.pack(side="left", padx=5, pady=8)
 
         # Categories info
-        cat_card = self.create_glass_card(self.content_area)
+        cat_card = self.create_glass_card(view)
         cat_card.pack(fill="both", expand=True, pady=(0, 20))
 
         cat_title = ctk.CTkLabel(
@@ -448,7 +773,7 @@ class RiotFileOrganizer:
             name = ctk.CTkLabel(
                 cat_frame,
                 text=cat_name,
-                font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+                font=self.style_bold,
                 text_color=color,
             )
             name.pack(anchor="w")
@@ -456,7 +781,7 @@ class RiotFileOrganizer:
             desc_label = ctk.CTkLabel(
                 cat_frame,
                 text=desc,
-                font=ctk.CTkFont(family="Segoe UI", size=12),
+                font=self.style_small,
                 text_color=COLORS["text_secondary"],
             )
             desc_label.pack(anchor="w", pady=(2, 0))
@@ -464,20 +789,19 @@ class RiotFileOrganizer:
         ctk.CTkLabel(cat_card, text="").pack(pady=5)
 
         # Action buttons
-        btn_frame = ctk.CTkFrame(self.content_area, fg_color="transparent")
+        btn_frame = ctk.CTkFrame(view, fg_color="transparent")
         btn_frame.pack(fill="x")
 
-        self.create_accent_button(btn_frame, "PREVIEW FIRST", self.show_preview).pack(
-            side="left", fill="both", expand=True, padx=(0, 10)
-        )
-        self.create_accent_button(btn_frame, "EXECUTE", self.on_organize, accent=True).pack(
-            side="left", fill="both", expand=True
+        preview_btn = self.create_accent_button(
+            btn_frame, "PREVIEW FIRST", lambda: self.switch_tab("preview")
         )
+        preview_btn.pack(side="left", fill="both", expand=True, padx=(0, 10))
+        self.create_run_button(btn_frame, "EXECUTE").pack(side="left", fill="both", expand=True)
 
-    def show_preview(self) -> None:
+    def show_preview(self, view: ctk.CTkFrame) -> None:
         """Preview tab"""
         header = ctk.CTkLabel(
-            self.content_area,
+            view,
             text="PREVIEW",
             font=self.style_title,
             text_color=COLORS["accent_cyan"],
@@ -487,7 +811,7 @@ class RiotFileOrganizer:
         folder = Path(self.folder_var.get()).expanduser()
 
         if not folder.exists():
-            error_card = self.create_glass_card(self.content_area)
+            error_card = self.create_glass_card(view)
             error_card.pack(fill="both", expand=True)
 
             error_label = ctk.CTkLabel(
@@ -501,7 +825,7 @@ class RiotFileOrganizer:
 
         moves = preview_organization(folder)
 
-        preview_card = self.create_glass_card(self.content_area)
+        preview_card = self.create_glass_card(view)
         preview_card.pack(fill="both", expand=True, pady=(0, 20))
 
         # Count
@@ -516,7 +840,7 @@ class RiotFileOrganizer:
         # Preview text
         preview_text = ctk.CTkTextbox(
             preview_card,
-            font=ctk.CTkFont(family="Courier", size=13),
+            font=self.style_mono,
             text_color=COLORS["text_secondary"],
             fg_color=COLORS["bg_primary"],
             border_color=COLORS["border"],
@@ -524,27 +848,36 @@ class RiotFileOrganizer:
         )
         preview_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
-        for i, (src, dest) in enumerate(moves, 1):
-            rel_dest = dest.relative_to(folder)
-            preview_text.insert("end", f"{i:3d}. {src.name}\n     → {rel_dest}\n\n")
+        # One insert instead of one per file keeps Tk from re-laying out the text each time
+        base_prefix = os.path.join(folder, "")
+        preview_text.insert(
+            "end",
+            "".join(
+                f"{i:3d}. {os.path.basename(src)}\n     → {relative_display(dest, base_prefix)}\n\n"
+                for i, (src, dest) in enumerate(moves[:PREVIEW_ROWS], 1)
+            ),
+        )
+        if len(moves) > PREVIEW_ROWS:
+            preview_text.insert("end", f"     … {len(moves) - PREVIEW_ROWS} more\n")
 
         preview_text.configure(state="disabled")
 
         # Action buttons
-        btn_frame = ctk.CTkFrame(self.content_area, fg_color="transparent")
+        btn_frame = ctk.CTkFrame(view, fg_color="transparent")
         btn_frame.pack(fill="x")
 
-        self.create_accent_button(btn_frame, "PROCEED", self.on_organize, accent=True).pack(
+        self.create_run_button(btn_frame, "PROCEED").pack(
             side="left", fill="both", expand=True, padx=(0, 10)
         )
-        self.create_accent_button(btn_frame, "BACK", self.show_organize, accent=False).pack(
-            side="left", fill="both", expand=True
+        back_btn = self.create_accent_button(
+            btn_frame, "BACK", lambda: self.switch_tab("organize"), accent=False
         )
+        back_btn.pack(side="left", fill="both", expand=True)
 
-    def show_history(self) -> None:
+    def show_history(self, view: ctk.CTkFrame) -> None:
         """History tab"""
         header = ctk.CTkLabel(
-            self.content_area,
+            view,
             text="HISTORY",
             font=self.style_title,
             text_color=COLORS["accent_cyan"],
@@ -552,7 +885,7 @@ class RiotFileOrganizer:
         header.pack(anchor="w", pady=(0, 20))
 
         if not self.history:
-            empty_card = self.create_glass_card(self.content_area)
+            empty_card = self.create_glass_card(view)
             empty_card.pack(fill="both", expand=True)
 
             empty_label = ctk.CTkLabel(
@@ -562,41 +895,53 @@ class RiotFileOrganizer:
                 text_color=COLORS["text_secondary"],
             )
             empty_label.pack(pady=40)
+            self.history_list = None
             return
 
         # Create scrollable frame for history entries
         scroll_frame = ctk.CTkScrollableFrame(
-            self.content_area,
+            view,
             fg_color=COLORS["bg_primary"],
             label_text="",
         )
         scroll_frame.pack(fill="both", expand=True, pady=(0, 20))
+        self.history_list = scroll_frame
+        self.history_entries = []
 
         # Create expandable history entries
         for idx, run in enumerate(self.history):
             try:
-                print(f"[DEBUG] Creating entry {idx}: {run.get('label', 'N/A')}")
-                self.create_history_entry(scroll_frame, run, idx)
-            except Exception as e:
-                print(f"[ERROR] Failed to create history entry {idx}: {e}")
-                import traceback
-                traceback.print_exc()
+                log.debug("Creating entry %d: %s", idx, run.get("label", "N/A"))
+                self.history_entries.append(self.create_history_entry(scroll_frame, run, idx))
+            except Exception:
+                log.exception("Failed to create history entry %d", idx)
 
         # Clear button
         clear_btn = ctk.CTkButton(
-            self.content_area,
+            view,
             text="CLEAR HISTORY",
-            font=ctk.CTkFont(family="Segoe UI", size=11, weight="bold"),
+            font=self.style_button,
             fg_color=COLORS["accent_purple"],
             text_color=COLORS["bg_primary"],
             command=self.clear_history,
         )
         clear_btn.pack(fill="x")
 
-    def create_history_entry(self, parent, run: dict, index: int) -> None:
+    def prepend_history_entry(self, run: dict) -> None:
+        """Add the newest run to the built history list without rebuilding it"""
+        first = self.history_entries[0] if self.history_entries else None
+        self.history_entries.insert(0, self.create_history_entry(self.history_list, run, 0, before=first))
+        for stale in self.history_entries[len(self.history):]:
+            stale.destroy()
+        del self.history_entries[len(self.history):]
+
+    def create_history_entry(self, parent, run: dict, index: int, before=None) -> ctk.CTkFrame:
         """Create an expandable history entry"""
         container = ctk.CTkFrame(parent, fg_color=COLORS["bg_card"], corner_radius=8)
-        container.pack(fill="x", pady=5, padx=0)
+        if before is not None:
+            container.pack(fill="x", pady=5, padx=0, before=before)
+        else:
+            container.pack(fill="x", pady=5, padx=0)
 
         # Store expanded state
         is_expanded = tk.BooleanVar(value=False)
@@ -610,7 +955,7 @@ class RiotFileOrganizer:
         arrow_label = ctk.CTkLabel(
             header_frame,
             text="▶",
-            font=ctk.CTkFont(family="Segoe UI", size=16),
+            font=self.style_arrow,
             text_color=COLORS["accent_cyan"],
             width=20,
         )
@@ -623,7 +968,7 @@ class RiotFileOrganizer:
         title_label = ctk.CTkLabel(
             info_frame,
             text=run['label'],
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
+            font=self.style_large_bold,
             text_color=COLORS["text_primary"],
             anchor="w",
         )
@@ -632,7 +977,7 @@ class RiotFileOrganizer:
         files_label = ctk.CTkLabel(
             info_frame,
             text=f"📊 {len(run['moves'])} files",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=self.style_small,
             text_color=COLORS["text_secondary"],
             anchor="w",
         )
@@ -662,42 +1007,40 @@ class RiotFileOrganizer:
                     no_files = ctk.CTkLabel(
                         details_frame,
                         text="   No files were moved",
-                        font=ctk.CTkFont(family="Segoe UI", size=13),
+                        font=self.style,
                         text_color=COLORS["text_muted"],
                     )
                     no_files.pack(anchor="w", padx=10, pady=10)
                 else:
-                    for src, dest in run['moves']:
-                        try:
-                            rel_dest = dest.relative_to(run['base'])
-                            file_label = ctk.CTkLabel(
-                                details_frame,
-                                text=f"   • {src.name} → {rel_dest}",
-                                font=ctk.CTkFont(family="Courier", size=13),
-                                text_color=COLORS["text_secondary"],
-                                anchor="w",
-                            )
-                            file_label.pack(fill="x", padx=10, pady=2)
-                        except:
-                            file_label = ctk.CTkLabel(
-                                details_frame,
-                                text=f"   • {src.name} → {dest}",
-                                font=ctk.CTkFont(family="Courier", size=13),
-                                text_color=COLORS["text_secondary"],
-                                anchor="w",
-                            )
-                            file_label.pack(fill="x", padx=10, pady=2)
+                    # One textbox for the whole run; a label per file made expanding large runs slow
+                    base_prefix = os.path.join(run['base'], "")
+                    lines = [
+                        f"   • {os.path.basename(src)} → {relative_display(dest, base_prefix)}\n"
+                        for src, dest in run['moves']
+                    ]
+                    details_text = ctk.CTkTextbox(
+                        details_frame,
+                        font=self.style_mono,
+                        text_color=COLORS["text_secondary"],
+                        fg_color=COLORS["bg_primary"],
+                        height=min(len(lines), 15) * 22 + 10,
+                        wrap="none",
+                    )
+                    details_text.pack(fill="x", padx=10, pady=5)
+                    details_text.insert("end", "".join(lines))
+                    details_text.configure(state="disabled")
 
         # Make header clickable
         header_frame.bind("<Button-1>", lambda e: toggle_expand())
         arrow_label.bind("<Button-1>", lambda e: toggle_expand())
         title_label.bind("<Button-1>", lambda e: toggle_expand())
         files_label.bind("<Button-1>", lambda e: toggle_expand())
+        return container
 
-    def show_stats(self) -> None:
+    def show_stats(self, view: ctk.CTkFrame) -> None:
         """Statistics tab"""
         header = ctk.CTkLabel(
-            self.content_area,
+            view,
             text="STATISTICS",
             font=self.style_title,
             text_color=COLORS["accent_cyan"],
@@ -705,17 +1048,12 @@ class RiotFileOrganizer:
         header.pack(anchor="w", pady=(0, 20))
 
         total_runs = len(self.history)
-        total_files = sum(len(h["moves"]) for h in self.history)
+        total_files = self.total_files_moved
 
-        category_counts = {}
-        for run in self.history:
-            for src, dest in run["moves"]:
-                dest_str = str(dest)
-                category = dest_str.split("\\")[0] if "\\" in dest_str else dest_str
-                category_counts[category] = category_counts.get(category, 0) + 1
+        category_counts = self.history_category_counts()
 
         # Stats cards
-        stats_frame = ctk.CTkFrame(self.content_area, fg_color="transparent")
+        stats_frame = ctk.CTkFrame(view, fg_color="transparent")
         stats_frame.pack(fill="x", pady=(0, 30))
 
         stats = [
@@ -724,12 +1062,13 @@ class RiotFileOrganizer:
             ("CATEGORIES", len(category_counts), COLORS["accent_blue"]),
         ]
 
+        self.configure_stat_row(stats_frame, len(stats))
         for i, (label, value, color) in enumerate(stats):
             self.create_stat_card(stats_frame, label, str(value), i, color, font_size=18)
 
         # Category breakdown
         if category_counts:
-            cat_card = self.create_glass_card(self.content_area)
+            cat_card = self.create_glass_card(view)
             cat_card.pack(fill="both", expand=True)
 
             cat_title = ctk.CTkLabel(
@@ -740,43 +1079,69 @@ class RiotFileOrganizer:
             )
             cat_title.pack(anchor="w", padx=20, pady=(20, 15))
 
-            for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-                cat_frame = ctk.CTkFrame(cat_card, fg_color="transparent")
-                cat_frame.pack(fill="x", padx=20, pady=10)
-
-                cat_label = ctk.CTkLabel(
-                    cat_frame,
-                    text=f"{category.upper()}: {count} FILES",
-                    font=ctk.CTkFont(family="Segoe UI", size=12),
-                    text_color=COLORS["text_secondary"],
-                )
-                cat_label.pack(anchor="w")
-
-                # Progress bar simulation
-                bar_frame = ctk.CTkFrame(cat_frame, fg_color=COLORS["bg_primary"], height=4)
-                bar_frame.pack(fill="x", pady=(5, 0))
-
-                bar_fill = ctk.CTkFrame(
-                    bar_frame,
-                    fg_color=COLORS["accent_cyan"],
-                    height=4,
-                )
-                width_percent = min(count / max(category_counts.values()) * 100, 100)
-                bar_fill.place(relwidth=width_percent / 100)
+            rows = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
+            max_count = rows[0][1]
+            # A raw Tk canvas is not scaled by CustomTkinter, so apply the widget scaling
+            # (DPI and user setting) by hand to keep it in line with the labels around it
+            scaling = ctk.ScalingTracker.get_widget_scaling(cat_card)
+            row_height = round(44 * scaling)
+            text_top = round(10 * scaling)
+            bar_top = round(35 * scaling)
+            bar_bottom = bar_top + max(1, round(4 * scaling))
+            font = self.style_small.create_scaled_tuple(scaling)
+            # One canvas for every row: text and rectangles are far lighter than two frames per bar
+            bars = tk.Canvas(
+                cat_card,
+                height=row_height * len(rows),
+                bg=COLORS["bg_card"],
+                highlightthickness=0,
+            )
+            bars.pack(fill="x", padx=round(20 * scaling))
+
+            def draw_bars(event):
+                bars.delete("all")
+                for i, (category, count) in enumerate(rows):
+                    y = i * row_height
+                    bars.create_text(
+                        0,
+                        y + text_top,
+                        text=f"{category.upper()}: {count} FILES",
+                        font=font,
+                        fill=COLORS["text_secondary"],
+                        anchor="nw",
+                    )
+                    fill_width = int(count / max_count * event.width)
+                    bars.create_rectangle(
+                        0, y + bar_top, event.width, y + bar_bottom, fill=COLORS["bg_primary"], outline=""
+                    )
+                    bars.create_rectangle(
+                        0, y + bar_top, fill_width, y + bar_bottom, fill=COLORS["accent_cyan"], outline=""
+                    )
+
+            bars.bind("<Configure>", draw_bars)
 
             ctk.CTkLabel(cat_card, text="").pack(pady=10)
 
-    def show_settings(self) -> None:
+    def history_category_counts(self) -> Dict[str, int]:
+        """Files moved per category, cached until the history changes"""
+        if self.category_counts is None:
+            counts: Counter[str] = Counter()
+            for run in self.history:
+                counts.update(run["categories"])
+            self.category_counts = dict(counts)
+        return self.category_counts
+
+    def show_settings(self, view: ctk.CTkFrame) -> None:
         """Settings tab"""
         header = ctk.CTkLabel(
-            self.content_area,
+            view,
             text="SETTINGS",
             font=self.style_title,
             text_color=COLORS["accent_cyan"],
         )
         header.pack(anchor="w", pady=(0, 20))
 
-        settings_card = self.create_glass_card(self.content_area)
+        settings_card = self.create_glass_card(view)
         settings_card.pack(fill="both", expand=True)
 
         settings_title = ctk.CTkLabel(
@@ -802,7 +1167,7 @@ class RiotFileOrganizer:
             name = ctk.CTkLabel(
                 setting_frame,
                 text=setting_name,
-                font=ctk.CTkFont(family="Segoe UI", size=12, weight="bold"),
+                font=self.style_small_bold,
                 text_color=COLORS["accent_cyan"],
                 width=100,
             )
@@ -811,37 +1176,41 @@ class RiotFileOrganizer:
             value = ctk.CTkLabel(
                 setting_frame,
                 text=setting_value,
-                font=ctk.CTkFont(family="Segoe UI", size=12),
+                font=self.style_small,
                 text_color=COLORS["text_secondary"],
             )
             value.pack(side="left", anchor="w")
 
         ctk.CTkLabel(settings_card, text="").pack(pady=10)
 
+    def cached_font(self, size: int, weight: str = "bold", family: str = "Segoe UI") -> ctk.CTkFont:
+        """Return a shared font for sizes only known when a widget is built"""
+        key = (family, size, weight)
+        font = self.font_cache.get(key)
+        if font is None:
+            font = self.font_cache[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+        return font
+
     def create_glass_card(self, parent) -> ctk.CTkFrame:
         """Create a glass-morphism card"""
-        return ctk.CTkFrame(
-            parent,
-            fg_color=COLORS["bg_card"],
-            border_color=COLORS["border"],
-            border_width=1,
-            corner_radius=8,
-        )
+        return ctk.CTkFrame(parent, **GLASS_CARD_STYLE)
+
+    def configure_stat_row(self, parent, count: int) -> None:
+        """Give every stat card column an equal share of the row in one Tk call"""
+        parent.grid_columnconfigure(tuple(range(count)), weight=1, uniform="stats")
 
     def create_stat_card(self, parent, label: str, value: str, index: int, color: str = None, font_size: int = 14) -> None:
         """Create a stat card"""
         if color is None:
-            colors = [COLORS["accent_cyan"], COLORS["accent_purple"], COLORS["accent_blue"]]
-            color = colors[index % len(colors)]
+            color = STAT_CARD_COLORS[index % len(STAT_CARD_COLORS)]
 
         card = self.create_glass_card(parent)
         card.grid(row=0, column=index, sticky="nsew", padx=(0, 15))
-        parent.grid_columnconfigure(index, weight=1)
 
         label_widget = ctk.CTkLabel(
             card,
             text=label,
-            font=ctk.CTkFont(family="Segoe UI", size=10, weight="bold"),
+            font=self.style_tiny_bold,
             text_color=COLORS["text_secondary"],
         )
         label_widget.pack(anchor="w", padx=15, pady=(15, 8))
@@ -849,37 +1218,36 @@ class RiotFileOrganizer:
         value_widget = ctk.CTkLabel(
             card,
             text=value,
-            font=ctk.CTkFont(family="Segoe UI", size=font_size + 8, weight="bold"),
+            font=self.cached_font(font_size + 8),
             text_color=color,
         )
         value_widget.pack(anchor="w", padx=15, pady=(0, 15))
 
     def create_accent_button(self, parent, text: str, command, accent: bool = True, size: int = 11):
         """Create an accent button"""
-        if accent:
-            return ctk.CTkButton(
-                parent,
-                text=text,
-                font=ctk.CTkFont(family="Segoe UI", size=size, weight="bold"),
-                fg_color=COLORS["accent_cyan"],
-                hover_color=COLORS["accent_purple"],
-                text_color=COLORS["bg_primary"],
-                height=45,
-                command=command,
-            )
-        else:
-            return ctk.CTkButton(
-                parent,
-                text=text,
-                font=ctk.CTkFont(family="Segoe UI", size=size, weight="bold"),
-                fg_color=COLORS["bg_card"],
-                border_color=COLORS["border"],
-                border_width=1,
-                text_color=COLORS["accent_cyan"],
-                hover_color=COLORS["bg_secondary"],
-                height=45,
-                command=command,
-            )
+        return ctk.CTkButton(
+            parent,
+            text=text,
+            font=self.cached_font(size),
+            command=command,
+            **(ACCENT_BUTTON_STYLE if accent else PLAIN_BUTTON_STYLE),
+        )
+
+    def create_run_button(self, parent, text: str) -> ctk.CTkButton:
+        """Create a button that starts organizing, tracking it for busy state"""
+        button = self.create_accent_button(parent, text, self.on_organize, accent=True)
+        self.run_buttons.append((button, text))
+        self.refresh_run_button()
+        return button
+
+    def refresh_run_button(self) -> None:
+        """Disable the run buttons while a worker is organizing"""
+        self.run_buttons = [(b, text) for b, text in self.run_buttons if b.winfo_exists()]
+        for button, text in self.run_buttons:
+            if self.is_organizing:
+                button.configure(state="disabled", text="ORGANIZING...")
+            else:
+                button.configure(state="normal", text=text)
 
     def choose_folder(self) -> None:
         selected = filedialog.askdirectory(title="Select folder to organize")
@@ -889,7 +1257,8 @@ class RiotFileOrganizer:
     def on_organize(self) -> None:
         folder = Path(self.folder_var.get()).expanduser()
 
-        if not folder.exists() or not folder.is_dir():
+        # is_dir() is False for missing paths too, so one stat covers both checks
+        if not folder.is_dir():
             messagebox.showerror("Error", "Please select a valid folder")
             return
 
@@ -898,78 +1267,185 @@ class RiotFileOrganizer:
             return
 
         self.is_organizing = True
+        self.refresh_run_button()
+        started = datetime.now()
+        progress_queue = self.progress_queue = queue.Queue()
+        self.progress_job = self.root.after(50, self.drain_progress)
 
+        # The worker only touches the file system; history and widgets are
+        # updated back on the Tk thread via root.after.
         def organize_thread():
             try:
-                moves = organize_folder(folder)
-                self.add_history(folder, moves)
-                self.root.after(0, lambda: self.show_success(len(moves)))
+                moves = organize_folder(folder, lambda done, total: progress_queue.put((done, total)))
+            except OrganizeError as e:
+                error, moved = str(e), e.moves
+                self.root.after(0, lambda: self.on_organize_failed(error, folder, moved, started))
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
-            finally:
-                self.is_organizing = False
+                error = str(e)
+                self.root.after(0, lambda: self.on_organize_failed(error))
+            else:
+                self.root.after(0, lambda: self.on_organize_done(folder, moves, started))
 
         Thread(target=organize_thread, daemon=True).start()
 
+    def drain_progress(self) -> None:
+        """Show the latest worker progress on the run buttons"""
+        # Polled on a timer so a fast worker never floods the Tk event queue
+        latest = None
+        try:
+            while True:
+                latest = self.progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if latest is not None:
+            done, total = latest
+            for button, _ in self.run_buttons:
+                if button.winfo_exists():
+                    button.configure(text=f"ORGANIZING {done}/{total}")
+        self.progress_job = self.root.after(50, self.drain_progress)
+
+    def stop_progress(self) -> None:
+        if self.progress_job is not None:
+            self.root.after_cancel(self.progress_job)
+            self.progress_job = None
+
+    def on_organize_done(self, folder: Path, moves: List[Tuple[str, str]], started: datetime) -> None:
+        self.is_organizing = False
+        self.stop_progress()
+        self.add_history(folder, moves, started)
+        self.refresh_run_button()
+        self.show_success(len(moves))
+
+    def on_organize_failed(
+        self,
+        error: str,
+        folder: Path | None = None,
+        moves: List[Tuple[str, str]] | None = None,
+        started: datetime | None = None,
+    ) -> None:
+        self.is_organizing = False
+        self.stop_progress()
+        # Files moved before the failure are still recorded so the run can be traced
+        if moves:
+            self.add_history(folder, moves, started)
+        self.refresh_run_button()
+        if moves:
+            error = f"{error}\n\n{len(moves)} files were moved before the error."
+        messagebox.showerror("Error", error)
+
     def show_success(self, count: int) -> None:
         messagebox.showinfo("Success", f"✨ {count} files organized!")
         self.switch_tab("history")
 
-    def add_history(self, base: Path, moves: List[Tuple[Path, Path]]) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def add_history(self, base: Path, moves: List[Tuple[str, str]], started: datetime | None = None) -> None:
+        # Label runs by when they started; isoformat avoids strftime's format parsing
+        timestamp = (started or datetime.now()).isoformat(sep=" ", timespec="seconds")
         entry = {
             "label": f"{timestamp} • {base}",
             "moves": moves,
             "base": base,
+            "categories": run_categories(base, moves),
         }
-        print(f"[DEBUG] Adding history entry with {len(moves)} moves")
-        self.history.insert(0, entry)
-        if len(self.history) > 50:
-            self.history = self.history[:50]
-        print(f"[DEBUG] Total history entries: {len(self.history)}")
-        self.save_history()
+        entry["serialized"] = serialize_run(entry)
+        log.debug("Adding history entry with %d moves", len(moves))
+        if len(self.history) == HISTORY_LIMIT:
+            self.total_files_moved -= len(self.history[-1]["moves"])
+        self.history.appendleft(entry)
+        self.category_counts = None
+        self.total_files_moved += len(moves)
+        log.debug("Total history entries: %d", len(self.history))
+        self.schedule_history_save()
+        if self.history_list is not None and self.history_list.winfo_exists():
+            self.prepend_history_entry(entry)
+            self.invalidate_history_tabs(("home", "stats", "settings"))
+        else:
+            self.invalidate_history_tabs()
 
     def clear_history(self) -> None:
         if messagebox.askyesno("Confirm", "Clear all history?"):
-            self.history = []
-            self.save_history()
-            self.show_history()
-
-    def save_history(self) -> None:
+            self.history.clear()
+            self.category_counts = None
+            self.total_files_moved = 0
+            self.schedule_history_save()
+            self.invalidate_history_tabs()
+
+    def schedule_history_save(self) -> None:
+        """Mark history dirty and coalesce writes into one deferred save"""
+        self.history_dirty = True
+        if self.history_save_job is None:
+            self.history_save_job = self.root.after(500, self.flush_history)
+
+    def flush_history(self) -> None:
+        if self.history_save_job is not None:
+            self.root.after_cancel(self.history_save_job)
+            self.history_save_job = None
+        # Saving before the file has been read would overwrite older runs
+        if not (self.history_dirty and self.history_loaded):
+            return
+        self.history_dirty = False
+        # Snapshot on the Tk thread; the single writer thread encodes and writes in order
+        serializable = [run["serialized"] for run in self.history]
+        # Runs never change once serialized, so identical objects mean an identical file
+        saved = self.saved_runs
+        if saved is not None and len(saved) == len(serializable) and all(map(operator.is_, saved, serializable)):
+            return
+        self.saved_runs = serializable
+        self.history_writer.submit(self.save_history, serializable)
+
+    def on_close(self) -> None:
+        self.closing = True
+        if not self.history_loaded:
+            self.merge_loaded_history(read_history(self.history_file))
+        self.flush_history()
+        self.history_writer.shutdown(wait=True)
+        self.root.destroy()
+
+    def save_history(self, serializable: List[dict]) -> None:
         try:
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            serializable = []
-            for run in self.history:
-                serializable.append({
-                    "label": run.get("label", ""),
-                    "base": str(run.get("base", "")),
-                    "moves": [{"src": str(src), "dest": str(dest)} for src, dest in run.get("moves", [])],
-                })
-            with self.history_file.open("w", encoding="utf-8") as fh:
-                json.dump(serializable, fh, indent=2)
+            # Write next to the real file and swap it in so a crash never leaves half a file
+            tmp_file = self.history_file.with_name(self.history_file.name + ".tmp")
+            # Paths share long prefixes, so even a fast compression level shrinks the file several times
+            tmp_file.write_bytes(gzip.compress(dump_json(serializable), compresslevel=3))
+            os.replace(tmp_file, self.history_file)
         except Exception:
-            pass
+            # The file is stale: forget the recorded snapshot so the next flush (or on_close)
+            # writes again instead of skipping it as unchanged. Plain attribute stores, so
+            # the worst a race with the Tk thread can cause is one redundant write.
+            self.saved_runs = None
+            self.history_dirty = True
 
     def load_history(self) -> None:
-        if not self.history_file.exists():
-            self.history = []
+        """Read the history file on a worker thread so startup never waits on disk"""
+        history_file = self.history_file
+
+        def load_thread():
+            runs = read_history(history_file)
+            try:
+                self.root.after(0, lambda: self.apply_loaded_history(runs))
+            except (RuntimeError, tk.TclError):
+                # Expected only when the window closed first; on_close reads the file itself then
+                if not self.closing:
+                    log.exception("Failed to hand loaded history to the window")
+
+        Thread(target=load_thread, daemon=True).start()
+
+    def merge_loaded_history(self, runs: List[dict]) -> None:
+        # Runs finished before the file was read are newer, so they stay on top
+        self.history = deque(islice(chain(self.history, runs), HISTORY_LIMIT), maxlen=HISTORY_LIMIT)
+        self.saved_runs = [run["serialized"] for run in runs]
+        self.category_counts = None
+        # Loading happens once, so a full count here keeps every later update O(1)
+        self.total_files_moved = sum(len(run["moves"]) for run in self.history)
+        self.history_loaded = True
+
+    def apply_loaded_history(self, runs: List[dict]) -> None:
+        if self.history_loaded:
             return
-        try:
-            data = json.loads(self.history_file.read_text(encoding="utf-8"))
-            raw_runs = data if isinstance(data, list) else data.get("history", [])
-            loaded = []
-            for run in raw_runs:
-                base = Path(run.get("base", "")) if run.get("base") else Path.home()
-                moves_list = []
-                for mv in run.get("moves", []):
-                    try:
-                        moves_list.append((Path(mv.get("src", "")), Path(mv.get("dest", ""))))
-                    except Exception:
-                        continue
-                loaded.append({"label": run.get("label", ""), "base": base, "moves": moves_list})
-            self.history = loaded[:50]
-        except Exception:
-            self.history = []
+        self.merge_loaded_history(runs)
+        if self.history_dirty:
+            self.schedule_history_save()
+        self.invalidate_history_tabs()
 
 
 def main() -> None: